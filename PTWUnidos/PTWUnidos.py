@@ -1,6 +1,27 @@
+import asyncio
+import concurrent.futures
+import math
+import os
 import pyvisa
+import re
+import threading
 import time
 
+# Weight of the last measurement in the estimation of the duration of nulls
+# and integrations (exponentially weighted moving average).
+_EWMA_WEIGHT = 0.3
+
+# Tokens of at least two characters in the responses of the electrometer
+# (single characters are separators or flags).
+_TOKEN_RE = re.compile(rb"\S{2,}")
+
+# Number used by the electrometer for each range.
+_RANGE_MAP = {"Low": 0, "low": 0, "Medium": 1, "medium": 1, "High": 2, "high": 2}
+
+# Queries that do not change the state of the electrometer. Any other command
+# invalidates the cached responses.
+_READ_ONLY_COMMANDS = {"?F", "?W", "?S", "?R", "?U", "?C", "V", "SER", "PTW"}
+
 class PTWUnidos:
 
     """Class for remote comunication with the PTW UNIDOS electrometer
@@ -48,6 +69,12 @@ class PTWUnidos:
         Perform an integration.
     doNull()
         Perform a null in the electrometer.
+    integrateAsync()
+        Perform an integration without blocking the event loop.
+    doNullAsync()
+        Perform a null without blocking the event loop.
+    cancel()
+        Cancel the wait of a null or an integration in progress.
     goToSetupPosition()
         Go to the charge mode and set the cursor in the setup menu.
     close()
@@ -77,14 +104,48 @@ class PTWUnidos:
         self.serial.read_termination  = '\r\n'
         self.serial.write_termination = '\r\n'
 
-        ## List of voltages admitted by the electrometer
-        self.__listOfVoltages = [0, 50, 100, 150, 200, 250, 300, 350, 400]
+        ## Bound methods used on each command, avoiding query() overhead.
+        self._write = self.serial.write_raw
+        self._read  = self.serial.read
 
+        # Reduce the latency timer of USB-serial adapters and the size of the
+        # I/O buffers (see README).
+        self._setLowLatency(serialPort)
+        self._configureBuffers()
 
-        if self._sendCommand("PTW", False).split(" ")[0] == "UNIDOS":
+        ## List of voltages admitted by the electrometer
+        self.__listOfVoltages = [0, 50, 100, 150, 200, 250, 300, 350, 400]
+        self.__voltageIndex   = {v: i for i, v in enumerate(self.__listOfVoltages)}
+
+        ## Estimated duration of a null and extra time that the electrometer
+        ## takes to finish an integration. Updated after each operation.
+        self._nullDuration        = 75.0
+        self._integrationOverhead = 0.0
+
+        ## Cancellation token of the null or integration in progress, set by
+        ## cancel(). Each operation has its own token.
+        self._cancelled = threading.Event()
+
+        ## Single worker thread for the asynchronous methods, which run one
+        ## after the other, and tokens of the submitted jobs. The synchronous
+        ## methods do not go through it: do not call them while an
+        ## asynchronous method is running.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+        self._jobs     = set()
+
+        ## Cache of responses to read-only queries: {command: (time, response)}
+        ## and time (in s) during which each response is valid. The status is
+        ## not cached since it changes while integrating or doing a null.
+        self._cache    = {}
+        self._cacheTTL = {"?W": 0.2, "?F": 1.0, "?U": 5.0, "?R": 5.0,
+                          "SER": math.inf, "PTW": math.inf}
+
+        identification = self._query("PTW").split(" ", 1)
+
+        if identification[0] == "UNIDOS":
         
-            self.version = self._sendCommand("PTW", False).split(" ")[1]
-            self.serNo   = self._sendCommand("SER", False)
+            self.version = identification[1].split(" ")[0]
+            self.serNo   = self._query("SER")
         
             print(f"PTW {self.version} electrometer. Serial number: {self.serNo}")
 
@@ -106,29 +167,90 @@ class PTWUnidos:
 
         return self.__listOfVoltages
     
+    def _setLowLatency(self, serialPort: str) -> None:
+        """Reduce the latency timer of the USB-serial adapter to ~1 ms.
+
+        FTDI based adapters buffer incoming data for 16 ms by default, which
+        dominates the round-trip time of each command. If the port is not an
+        USB-serial adapter (or the backend does not allow it) nothing is done.
+
+        Parameters
+        ----------
+        serialPort : str
+            String with the direction of the port where the instrument is
+            conected.
+        """
+
+        # pyvisa-py exposes the underlying pyserial object.
+        try:
+            interface = self.serial.visalib.sessions[self.serial.session].interface
+            interface.set_low_latency_mode(True)
+            return
+        except Exception:
+            pass
+
+        # Fallback for Linux: write directly the latency timer in sysfs.
+        device = os.path.basename(serialPort.split("::")[0])
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{device}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
+    def _configureBuffers(self) -> None:
+        """Reduce the I/O buffers and set the timeouts of the serial port, so
+        short commands are not held by the driver. Each setting is applied
+        only if the backend supports it.
+        """
+
+        # Small I/O buffers (viSetBuf, not implemented by pyvisa-py).
+        try:
+            self.serial.visalib.set_buffer(self.serial.session, pyvisa.constants.VI_IO_OUT_BUF, 64)
+            self.serial.visalib.set_buffer(self.serial.session, pyvisa.constants.VI_IO_IN_BUF, 256)
+        except Exception:
+            pass
+
+        # Timeouts of the underlying pyserial object (pyvisa-py only).
+        try:
+            interface = self.serial.visalib.sessions[self.serial.session].interface
+            interface.write_timeout      = 0.1
+            interface.inter_byte_timeout = None
+        except Exception:
+            pass
+
     def getFlags(self) -> str:
         """Retrieve information of the electrometer."""
-        response = int(self._sendCommand("?F", False))
+        response = int(self._query("?F", 3))
         return f'{response:08b}'
+
+    def _getFlagBit(self, bit: int) -> int:
+        """Get a single bit of the flags of the electrometer.
+
+        Parameters
+        ----------
+        bit : int
+            Position of the bit, starting from the least significant one.
+
+        Returns
+        -------
+        int
+            Value of the bit (0 or 1).
+        """
+
+        return (int(self._query("?F", 3)) >> bit) & 1
     
     def setElectricalUnits(self) -> None:
         """Set the electrical units in the electrometer rather than the
         radiological ones."""
         
-        if self.getFlags()[-3] == "1":
+        if self._getFlagBit(2):
 
             # Go to setup position
             self.goToSetupPosition()
-            # Enter the chamber menu
-            self._sendCommand("E")
-            # Go one step down
-            self._sendCommand("D")
-            # Change the units
-            self._sendCommand("E")
-            self._sendCommand("U")
-            self._sendCommand("E")
+            # Enter the chamber menu, go one step down and change the units
+            self._pressKeys(["E", "D", "E", "U", "E"])
             # Ask for the units
-            if self.getFlags()[-3] == "1":
+            if self._getFlagBit(2):
                 print("Electrical units not set correctly")
 
             self.goToSetupPosition()
@@ -141,7 +263,7 @@ class PTWUnidos:
         str
             Current position in terms of numbers (see documentation).        
         """
-        return self._sendCommand("?W", False)
+        return self._query("?W", 4)
     
     def getStatus(self) -> str:
         """Get the current status of the electrometer.
@@ -152,27 +274,126 @@ class PTWUnidos:
             Current status of the electrometer.
         """
 
-        return self._sendCommand("?S", False)
+        return self._query("?S", 4)
     
     def doNull(self) -> None:
-        """Perform a null in the electrometer. This operation takes 75 s."""
-        
-        self._sendCommand("N", False)
-        time.sleep(75)
+        """Perform a null in the electrometer. This operation takes ~75 s."""
+
+        self._doNull(threading.Event())
+
+    def _doNull(self, cancelled: threading.Event) -> None:
+        """Perform a null in the electrometer.
+
+        Parameters
+        ----------
+        cancelled : threading.Event
+            Cancellation token of this null.
+        """
+
+        self._cancelled = cancelled
+        if cancelled.is_set():
+            print("Null cancelled")
+            return
+
+        start = time.monotonic()
+        self._query("N")
 
-        while self.getStatus() == "NUL":
-            time.sleep(5)
+        # Wait the time learnt from previous nulls and then poll the status.
+        if self._waitUntil(start + self._nullDuration - 1, cancelled) or \
+           self._waitWhileStatus("NUL", 0.2, 2.0, cancelled):
+            print("Null cancelled")
+            return
+
+        duration = time.monotonic() - start
+        self._nullDuration += _EWMA_WEIGHT * (duration - self._nullDuration)
+
+    def cancel(self) -> None:
+        """Cancel the wait of a null or an integration in progress. Intended to
+        be called from another thread. Notice that only the wait is cancelled:
+        the electrometer keeps integrating or doing the null."""
+
+        self._cancelled.set()
+
+    def _waitUntil(self, deadline: float, cancelled: threading.Event) -> bool:
+        """Wait until the given time.monotonic() deadline, in steps of at most
+        1 s so the wait can be interrupted or cancelled promptly.
+
+        Parameters
+        ----------
+        deadline : float
+            Time, as given by time.monotonic(), at which the wait ends.
+        cancelled : threading.Event
+            Cancellation token of the operation.
+
+        Returns
+        -------
+        bool
+            True if the wait has been cancelled.
+        """
+
+        while not cancelled.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: return False
+            cancelled.wait(min(1.0, remaining))
+
+        return True
+
+    def _waitWhileStatus(self, status: str, delay: float, maxDelay: float,
+                         cancelled: threading.Event) -> bool:
+        """Poll the status of the electrometer, increasing the delay between
+        queries, until it is different from the given one.
+
+        Parameters
+        ----------
+        status : str
+            Status to wait for its end.
+        delay : float
+            Initial delay between queries in seconds.
+        maxDelay : float
+            Maximum delay between queries in seconds.
+        cancelled : threading.Event
+            Cancellation token of the operation.
+
+        Returns
+        -------
+        bool
+            True if the wait has been cancelled.
+        """
+
+        while self.getStatus() == status:
+            if self._waitUntil(time.monotonic() + delay, cancelled): return True
+            delay = min(delay * 1.5, maxDelay)
+
+        return False
 
     def goToSetupPosition(self) -> None:
         """Go to the charge mode and set the cursor in the setup menu."""
 
         r = self.getPosition()
+        if r == "00": return
+
+        # Close the submenus first and read the position again, so the cursor
+        # keys are never sent while editing a value.
+        if len(r) > 2:
+            self._pressKeys(["C"] * (len(r) - 2))
+            r = self.getPosition()
 
+        # Go to the charge mode.
+        if len(r) == 2 and r[0] != "0":
+            self._pressKeys(["M0"])
+            r = self.getPosition()
+
+        # Move the cursor up to the setup menu.
+        if len(r) == 2 and r[0] == "0" and r[1] != "0" and r[1].isdigit():
+            self._pressKeys(["U"] * int(r[1]))
+            r = self.getPosition()
+
+        # If the position is not the expected one, go step by step.
         while r != "00":
 
-            if len(r) > 2   : self._sendCommand("C")
-            elif r[0] != "0": self._sendCommand("M0")
-            elif r[1] != "0": self._sendCommand("U")
+            if len(r) > 2   : self._pressKeys(["C"])
+            elif r[0] != "0": self._pressKeys(["M0"])
+            elif r[1] != "0": self._pressKeys(["U"])
 
             r = self.getPosition()
 
@@ -188,19 +409,15 @@ class PTWUnidos:
         Raises
         ------
         AssertionError
-            If range is not Low, Medium or High.            
+            If range is not Low, Medium or High (or in lower case).
         """
 
-        # Assert range is in the list.
-        assert range in ["Low", "Medium", "High"], "Range not recognised"
-
         # Get the correct number to set the range.
-        if range == "Low" or range == "low":       x = 0
-        if range == "Medium" or range == "medium": x = 1
-        if range == "High" or range == "high":     x = 2
+        x = _RANGE_MAP.get(range)
+        assert x is not None, "Range not recognised"
 
         # Send the command to set the range.
-        self._sendCommand(f"R{x}")
+        self._queryChecked(f"R{x}")
 
 
     def getRange(self) -> list[str, str]:
@@ -214,7 +431,7 @@ class PTWUnidos:
 
         """
         
-        response      = self._sendCommand("?R", False)
+        response      = self._query("?R")
         splitResponse = response.split(" ")
 
         range = ""
@@ -241,21 +458,16 @@ class PTWUnidos:
         
         # Go to setup position
         self.goToSetupPosition()
-        # Go to the chamber menu
-        self._sendCommand("D")
-        # Enter the chamber menu
-        self._sendCommand("E")
-        # In the chamber menu we have to go down one time
-        self._sendCommand("D")
-        # Press enter to go insided the value
-        self._sendCommand("E")
+        # Go to the chamber menu, enter it, go down one time and press enter to
+        # go inside the value
+        self._pressKeys(["D", "E", "D", "E"])
         # Get the actual value
-        aValue = self._sendCommand("V", False)
+        aValue = self._query("V")
 
         # Return to reference position (if asked).
         if goToSetup: self.goToSetupPosition()
 
-        return int(aValue.split()[0])
+        return int(aValue.split(None, 1)[0])
 
     def setVoltage(self, voltage: int) -> None:
         """Set voltage on the electrometer
@@ -271,27 +483,24 @@ class PTWUnidos:
             If voltage is not in the list of allowed voltages
         """
 
-        assert voltage in self.listOfVoltages, f"{voltage} V is not a valid value of voltage"
+        assert voltage in self.__voltageIndex, f"{voltage} V is not a valid value of voltage"
 
         # Get the current value of the voltage and do not go to 
         # setup menu
         aVoltage = self.getVoltage(False)
 
-        currentVoltageIndex = self.listOfVoltages.index(aVoltage)
-        newVoltageIndex = self.listOfVoltages.index(voltage)
-
-        move = newVoltageIndex - currentVoltageIndex
-        if move > 0: [self._sendCommand("U") for i in range(move)]
-        if move < 0: [self._sendCommand("D") for i in range(-move)]
+        move = self.__voltageIndex[voltage] - self.__voltageIndex[aVoltage]
+        if move > 0: self._pressKeys(["U"] * move)
+        if move < 0: self._pressKeys(["D"] * -move)
 
         # Check that the new voltage is correctly set
-        if voltage != int(self._sendCommand("V", False).split()[0]):
+        if voltage != int(self._query("V").split(None, 1)[0]):
             print("Error setting the requested voltage, operation aborted.")
         else:
             # Press ENT
-            response = self._sendCommand("E", False)
+            response = self._query("E")
             # If the response is not Enter, we have probably to press STA key
-            if response != "E": self._sendCommand("G", False)
+            if response != "E": self._query("G")
 
         self.goToSetupPosition()
 
@@ -304,7 +513,7 @@ class PTWUnidos:
             Unit.
         """
 
-        return self._sendCommand("?U", False)
+        return self._query("?U")
 
     def getIntegrationTime(self, goToSetup: bool = True) -> int:
         """Get the current integration time set in the electrometer
@@ -323,11 +532,9 @@ class PTWUnidos:
         # Go to setup position
         self.goToSetupPosition()
         # Go to the setup menu
-        self._sendCommand("E")
-        # Go to the setup menu
-        self._sendCommand("E")
+        self._pressKeys(["E", "E"])
         # Get the actual value
-        aValue = self._sendCommand("V", False)
+        aValue = self._query("V")
         # Return to reference position
         if goToSetup: self.goToSetupPosition()
 
@@ -354,15 +561,13 @@ class PTWUnidos:
         # Go to setup position
         self.goToSetupPosition()
         # Go to the setup menu
-        self._sendCommand("E")
-        # Go to the setup menu
-        self._sendCommand("E")
+        self._pressKeys(["E", "E"])
         # Send the integration time
-        self._sendCommand(f"{integrationTime}".zfill(4))
+        self._queryChecked(f"{integrationTime:04d}", 4)
 
-        self._sendCommand("E")
+        self._pressKeys(["E"])
         # Check that the new integration time is correctly set
-        if integrationTime != int(self._sendCommand("V", False)):
+        if integrationTime != int(self._query("V")):
             print("Error setting the integration time, operation aborted.")
 
     def integrate(self) -> float:
@@ -370,9 +575,26 @@ class PTWUnidos:
 
         Returns
         -------
-            Value of the charge.
+            Value of the charge (nan if the integration is cancelled).
+        """
+
+        return self._integrate(threading.Event())
+
+    def _integrate(self, cancelled: threading.Event) -> float:
+        """Perform an integration.
+
+        Parameters
+        ----------
+        cancelled : threading.Event
+            Cancellation token of this integration.
+
+        Returns
+        -------
+            Value of the charge (nan if the integration is cancelled).
         """
 
+        self._cancelled = cancelled
+
         # Check where the electrometer is
         if self.getPosition()[0] != "00":
             self.goToSetupPosition()
@@ -380,34 +602,130 @@ class PTWUnidos:
         # Check the integration time
         integrationTime = self.getIntegrationTime()
 
+        if cancelled.is_set():
+            print("Integration cancelled")
+            return math.nan
+
         # Integrate in the electrometer
-        start = time.time()
-        self._sendCommand("I")
+        start = time.monotonic()
+        self._queryChecked("I")
 
-        time.sleep(integrationTime + 1)
+        # Wait until shortly before the expected end and then poll the status.
+        if self._waitUntil(start + integrationTime + self._integrationOverhead - 0.5, cancelled) or \
+           self._waitWhileStatus("INT", 0.05, 0.5, cancelled):
+            print("Integration cancelled")
+            return math.nan
 
-        while self.getStatus() == "INT": time.sleep(1)
+        overhead = time.monotonic() - start - integrationTime
+        self._integrationOverhead += _EWMA_WEIGHT * (overhead - self._integrationOverhead)
 
-        self.serial.write('V')
-        results      = self.serial.read_raw().decode("latin1").split(" ")
-        validResults = [value for value in results if len(value) > 1]
-        iTime        = validResults[0][:-1]
+        # Discard any pending data and read the result without decoding it.
+        self.serial.flush(pyvisa.constants.VI_READ_BUF_DISCARD |
+                          pyvisa.constants.VI_IO_IN_BUF_DISCARD)
+        self._write(b"V\r\n")
+        tokens = _TOKEN_RE.findall(self.serial.read_raw())
+        iTime  = tokens[0][:-1]
 
         if int(iTime) != integrationTime:
             print("Integration time missmatch")
 
-        charge = float(validResults[1])
+        charge = float(tokens[1])
         return charge
 
-    def _sendCommand(self, command: str, crossCheck: bool = True) -> str:
+    async def integrateAsync(self) -> float:
+        """Perform an integration without blocking the event loop, so other
+        instruments or a GUI can be served meanwhile. Cancelling the awaiting
+        task stops the wait, but not the integration in the electrometer.
+
+        Returns
+        -------
+            Value of the charge (nan if the integration is cancelled).
+        """
+
+        return await self._runInExecutor(self._integrate)
+
+    async def doNullAsync(self) -> None:
+        """Perform a null in the electrometer without blocking the event loop.
+        This operation takes ~75 s. Cancelling the awaiting task stops the
+        wait, but not the null in the electrometer."""
+
+        await self._runInExecutor(self._doNull)
+
+    async def _runInExecutor(self, method):
+        """Run a blocking method in the worker thread with its own cancellation
+        token. If the awaiting task is cancelled, the wait of the method is
+        cancelled too and the cancellation is only propagated once the worker
+        has stopped using the port.
+
+        Parameters
+        ----------
+        method : callable
+            Blocking method whose only argument is the cancellation token.
+
+        Returns
+        -------
+            Value returned by the method.
+        """
+
+        cancelled = threading.Event()
+        self._jobs.add(cancelled)
+        worker = self._executor.submit(method, cancelled)
+
+        try:
+            return await asyncio.wrap_future(worker)
+        except asyncio.CancelledError:
+            cancelled.set()
+            # Wait for the worker to stop before releasing the port.
+            try: await asyncio.shield(asyncio.wrap_future(worker))
+            except Exception: pass
+            raise
+        finally:
+            self._jobs.discard(cancelled)
+
+    def _query(self, command: str, maxLength: int = None) -> str:
         """Send a command to the electrometer
 
         Parameters
         ----------
         command : str
             Command to be send
-        crossCheck : bool [optional, default = True]
-            If True checks if the electrometer responds correctly.
+        maxLength : int [optional, default = None]
+            If given, maximum length of the response (see _sendRaw).
+
+        Returns
+        -------
+        str
+            String with the electrometer response.
+        """
+
+        # Return the cached response if it is still valid.
+        if command in self._cacheTTL and command in self._cache:
+            timestamp, response = self._cache[command]
+            if time.monotonic() - timestamp < self._cacheTTL[command]:
+                return response
+
+        if command not in _READ_ONLY_COMMANDS: self._invalidateCache()
+
+        if maxLength: response = self._sendRaw(command, maxLength)
+        else:
+            self._write(command.encode() + b"\r\n")
+            response = self._read()
+
+        if command in self._cacheTTL:
+            self._cache[command] = (time.monotonic(), response)
+
+        return response
+
+    def _queryChecked(self, command: str, maxLength: int = None) -> str:
+        """Send a command to the electrometer and check that it responds
+        correctly, i.e. with the same command.
+
+        Parameters
+        ----------
+        command : str
+            Command to be send
+        maxLength : int [optional, default = None]
+            If given, maximum length of the response (see _sendRaw).
 
         Returns
         -------
@@ -415,12 +733,85 @@ class PTWUnidos:
             String with the electrometer response.
         """
 
-        response = self.serial.query(command)
-        if response != command and crossCheck: 
+        response = self._query(command, maxLength)
+        if response != command: 
             print(f"Error sending command: {command}")
 
         return response
 
+    def _sendRaw(self, command: str, maxLength: int) -> str:
+        """Send a command to the electrometer and read a response of known
+        maximum length in a single read, stopping at the termination.
+
+        Parameters
+        ----------
+        command : str
+            Command to be send
+        maxLength : int
+            Maximum length of the response without the termination.
+
+        Returns
+        -------
+        str
+            String with the electrometer response.
+        """
+
+        self._write(command.encode() + b"\r\n")
+        response = self.serial.read_bytes(maxLength + 2, break_on_termchar = True)
+        response = response.decode("latin1")
+
+        # If the response is longer than expected, read the rest of it so the
+        # following responses are not shifted.
+        if not response.endswith("\n"): response += self._read()
+
+        return response.rstrip("\r\n")
+
+    def _pressKey(self, key: str) -> None:
+        """Send a key press to the electrometer without reading its echo. The
+        echo has to be consumed afterwards (see _pressKeys).
+
+        Parameters
+        ----------
+        key : str
+            Key command to be send.
+        """
+
+        self._write(key.encode() + b"\r\n")
+
+    def _pressKeys(self, keys: list[str]) -> list[str]:
+        """Press several keys and then read all their echoes at once, instead
+        of waiting for the echo of each key.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Key commands to be send, in order.
+
+        Returns
+        -------
+        list[str]
+            List with the electrometer responses.
+        """
+
+        if not keys: return []
+
+        self._invalidateCache()
+        for key in keys: self._pressKey(key)
+        responses = [self._read() for _ in keys]
+
+        for key, response in zip(keys, responses):
+            if response != key:
+                print(f"Error sending command: {key}")
+
+        return responses
+
+    def _invalidateCache(self) -> None:
+        """Remove the cached responses that may change when a command is sent
+        to the electrometer."""
+
+        self._cache = {command: value for command, value in self._cache.items()
+                       if self._cacheTTL[command] == math.inf}
+
     def getCorrections(self) -> str:
         """Get correction of applied by the electrometer.
 
@@ -430,7 +821,7 @@ class PTWUnidos:
             String with the corrections.
         """
 
-        return self._sendCommand("?C", False)
+        return self._query("?C")
     
     def getReading(self) -> list[str]:
         """Get a list with the data on the screen of the electrometer.
@@ -441,10 +832,15 @@ class PTWUnidos:
             List with the data in the screen of the electrometer.
         """
 
-        return self._sendCommand("V", False).split(" ")
+        return self._query("V").split(" ")
 
     def close(self) -> None:
-        """Close the communication with the electrometer."""
+        """Close the communication with the electrometer. The pending
+        asynchronous methods are cancelled and this call blocks until the one
+        in progress stops waiting (about 1 s)."""
+
+        for cancelled in list(self._jobs): cancelled.set()
+        self._executor.shutdown(wait = True, cancel_futures = True)
 
-        self._sendCommand("T1")
+        self._queryChecked("T1")
         self.serial.close()
\ No newline at end of file